@@ -7,6 +7,7 @@ import os
 import re
 import json
 import time
+import random
 import urllib.request
 import urllib.parse
 
@@ -615,9 +616,8 @@ Example: ["🦴 Did T-Rex eat other dinosaurs?", "🥚 How big were dino eggs?",
                 max_tokens=100,
                 temperature=0.9
             ))
-            import json as json_mod
             fu_text = fu_response.choices[0].message.content.strip()
-            follow_ups = json_mod.loads(fu_text)
+            follow_ups = json.loads(fu_text)
         except Exception:
             follow_ups = []
 
@@ -751,7 +751,6 @@ def generate_fact():
         available = [c for c in subtopic_pool if c.get("cat") not in used_categories]
         if not available:
             available = subtopic_pool  # Reset if all used
-        import random
         chosen = random.choice(available)
         category = chosen["cat"]
         category_example_correct = chosen["example_correct"]
@@ -1017,7 +1016,6 @@ def debug_image():
     steps = []
     wiki_result = None
     try:
-        import time
         t0 = time.time()
         image_type, search_term = classify_image_type(question)
         steps.append(f"1. Classify ({time.time()-t0:.1f}s): type={image_type}, term={search_term}")
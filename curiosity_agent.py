@@ -8,28 +8,94 @@ Usage:
 
 Requirements:
     pip install openai speechrecognition pyaudio playsound requests
+
+Optional (faster):
+    pip install h2                      # HTTP/2 connection to the OpenAI API
+    pip install sentence-transformers   # match reworded repeat questions
+    pip install sounddevice             # play speech straight from memory
+    pip install orjson                  # faster config.json reads/writes
 """
 
 import os
+import re
+import atexit
+import collections
+import functools
 import sys
 import json
+import queue
+import sqlite3
+import subprocess
 import tempfile
 import threading
+import time
+import uuid
 from pathlib import Path
 
+# orjson parses and writes config.json in C; plain json is the fallback
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Config file path (shared with web app)
 CONFIG_FILE = Path(__file__).parent / "config.json"
 
-
+# Local cache of answers and their spoken audio
+CACHE_FILE = Path(__file__).parent / "answer_cache.db"
+
+# Streamed answers are handed to TTS a sentence at a time; a sentence ends at
+# ".", "!" or "?" followed by whitespace (so "3.5" stays in one piece)
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])(?=\s)')
+
+# OpenAI TTS "pcm" output is 24 kHz, 16-bit, mono
+PCM_SAMPLE_RATE = 24000
+PCM_CHUNK_BYTES = 4096
+
+# Patterns used to clean answers before speaking them
+_EMOJI_RE = re.compile(
+    "["
+    "\U0001F300-\U0001F9FF"  # Various symbols and pictographs
+    "\U00002600-\U000026FF"  # Misc symbols
+    "\U00002700-\U000027BF"  # Dingbats
+    "]+"
+)
+_URL_RE = re.compile(r'https?://\S+|www\.\S+')
+_MD_LINK_RE = re.compile(r'\[([^\]]+)\]\([^)]+\)')
+_WS_RE = re.compile(r'\s+')
+_NON_WORD_RE = re.compile(r'\W+')
+
+
+def read_config() -> dict:
+    """Read the shared config.json file."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(CONFIG_FILE.read_bytes())
+    with open(CONFIG_FILE) as f:
+        return json.load(f)
+
+
+def write_config(config: dict):
+    """Write the shared config.json file."""
+    if ORJSON_AVAILABLE:
+        CONFIG_FILE.write_bytes(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+    else:
+        with open(CONFIG_FILE, 'w') as f:
+            json.dump(config, f, indent=2)
+
+
+@functools.lru_cache(maxsize=1)
 def load_api_key_from_config():
-    """Load API key from shared config.json file."""
+    """Load API key from shared config.json file (read once per process).
+
+    Call load_api_key_from_config.cache_clear() after rewriting config.json.
+    """
     if CONFIG_FILE.exists():
         try:
-            with open(CONFIG_FILE) as f:
-                config = json.load(f)
-                key = config.get("openai_api_key", "").strip()
-                if key:
-                    return key
+            config = read_config()
+            key = config.get("openai_api_key", "").strip()
+            if key:
+                return key
         except Exception as e:
             print(f"Warning: Could not read config.json: {e}")
     return None
@@ -38,11 +104,19 @@ def load_api_key_from_config():
 # Check for required packages
 try:
     import openai
+    import httpx
     from openai import OpenAI
 except ImportError:
     print("Please install openai: pip install openai")
     sys.exit(1)
 
+# HTTP/2 lets chat streaming and TTS share one connection
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 try:
     import speech_recognition as sr
     SPEECH_RECOGNITION_AVAILABLE = True
@@ -51,6 +125,15 @@ except ImportError:
     print("Note: speech_recognition not installed. Voice input disabled.")
     print("Install with: pip install speechrecognition pyaudio")
 
+# Local embeddings let the answer cache match reworded questions
+# (torch can fail to load with errors other than ImportError)
+try:
+    import numpy as np
+    from sentence_transformers import SentenceTransformer
+    SEMANTIC_CACHE_AVAILABLE = True
+except Exception:
+    SEMANTIC_CACHE_AVAILABLE = False
+
 # Try to import audio playback
 try:
     from playsound import playsound
@@ -58,10 +141,237 @@ try:
 except ImportError:
     PLAYSOUND_AVAILABLE = False
 
+# Streams raw PCM to the speakers without a temp file or mp3 decoder
+# (OSError means the package is installed but the PortAudio library isn't)
+try:
+    import sounddevice as sd
+    SOUNDDEVICE_AVAILABLE = True
+except (ImportError, OSError):
+    SOUNDDEVICE_AVAILABLE = False
+
+
+class AnswerCache:
+    """SQLite cache of answers by question and audio by spoken text (LRU).
+
+    Answers are only stored for questions asked with no prior conversation,
+    and expire after ANSWER_TTL.
+
+    When sentence-transformers is installed, questions that miss the exact
+    lookup are also compared by embedding against every cached question.
+    """
+
+    MAX_ANSWERS = 500
+    ANSWER_TTL = 7 * 24 * 3600  # answers expire after a week; audio never does
+    # Capped by size, not count: a PCM sentence is ~100 KB, mp3 ~15 KB
+    MAX_AUDIO_BYTES = 50 * 1024 * 1024
+
+    EMBED_MODEL = "all-MiniLM-L6-v2"
+    SIMILARITY_THRESHOLD = 0.92
+    INDEX_GROWTH = 1024  # rows added to the vector buffer when it fills up
+
+    def __init__(self, path: Path = CACHE_FILE):
+        self._lock = threading.Lock()
+        self._index_lock = threading.Lock()
+        self._embed_model = None  # set once load_semantic_index() finishes
+        self._index_keys = []
+        self._index_vectors = None  # preallocated; only the first len(keys) rows are used
+        self._last_query = (None, None)  # (key, vector) of the latest lookup
+        self._db = sqlite3.connect(
+            str(path), isolation_level=None, check_same_thread=False
+        )
+        # Tables from before the created column was added are just dropped;
+        # it's only a cache
+        for table in ("answers", "speech"):
+            columns = [row[1] for row in
+                       self._db.execute(f"PRAGMA table_info({table})")]
+            if columns and "created" not in columns:
+                self._db.execute(f"DROP TABLE {table}")
+        self._db.executescript("""
+            CREATE TABLE IF NOT EXISTS answers (
+                k TEXT PRIMARY KEY, answer TEXT NOT NULL,
+                created REAL NOT NULL, last_used REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS speech (
+                k TEXT PRIMARY KEY, audio BLOB NOT NULL,
+                created REAL NOT NULL, last_used REAL NOT NULL
+            );
+        """)
+
+    @staticmethod
+    def normalize(question: str) -> str:
+        """Normalize a question so trivial variations share a cache key."""
+        return _NON_WORD_RE.sub(' ', question.lower()).strip()
+
+    def get_answer(self, question: str):
+        """Return the cached answer for a question (or a close match), or None."""
+        # Only call this for questions asked with no prior conversation: a
+        # close match on a context-dependent question ("how big is it" vs
+        # "how big is that") would return an unrelated answer
+        key = self.normalize(question)
+        answer = self._get("answers", "answer", key, self.ANSWER_TTL)
+        if answer is None and self._embed_model is not None:
+            similar_key = self._find_similar(key)
+            if similar_key is not None:
+                answer = self._get("answers", "answer", similar_key,
+                                   self.ANSWER_TTL)
+                if answer is None:  # expired
+                    self._remove_from_index([similar_key])
+        return answer
+
+    def put_answer(self, question: str, answer: str):
+        """Cache an answer for a question (same no-prior-conversation rule)."""
+        key = self.normalize(question)
+        evicted = self._put("answers", "answer", key, answer,
+                            max_rows=self.MAX_ANSWERS)
+        if self._embed_model is not None:
+            # Keep the index in step with the table so lookups never land on
+            # an evicted question
+            self._remove_from_index(evicted)
+            # Usually this question just missed, so its vector is at hand
+            last_key, last_vector = self._last_query
+            vectors = [last_vector] if last_key == key else self._embed([key])
+            self._add_to_index([key], np.asarray(vectors))
+
+    def load_semantic_index(self):
+        """Load the embedding model and index the cached questions (slow)."""
+        if not SEMANTIC_CACHE_AVAILABLE:
+            return
+        try:
+            model = SentenceTransformer(self.EMBED_MODEL)
+        except Exception as e:
+            print(f"Note: similar-question matching disabled ({str(e)[:50]})")
+            return
+        self._embed_model = model
+
+        # Read the keys only now, so answers cached while the model was
+        # loading get indexed too (put_answer indexes everything after this)
+        with self._lock:
+            keys = [row[0] for row in self._db.execute("SELECT k FROM answers")]
+        if keys:
+            self._add_to_index(keys, self._embed(keys))
+
+    def _embed(self, keys: list):
+        return self._embed_model.encode(keys, normalize_embeddings=True)
+
+    def _add_to_index(self, keys: list, vectors):
+        vectors = np.asarray(vectors, dtype=np.float32)
+        with self._index_lock:
+            # Skip keys already indexed (re-cached or indexed by both the
+            # initial load and put_answer)
+            indexed = set(self._index_keys)
+            new = [i for i, k in enumerate(keys) if k not in indexed]
+            if not new:
+                return
+            keys = [keys[i] for i in new]
+            vectors = vectors[new]
+            count = len(self._index_keys)
+            needed = count + len(vectors)
+            if self._index_vectors is None or needed > len(self._index_vectors):
+                # Grow in whole chunks so inserts don't copy the matrix each time
+                capacity = -(-needed // self.INDEX_GROWTH) * self.INDEX_GROWTH
+                grown = np.empty((capacity, vectors.shape[1]), dtype=np.float32)
+                if count:
+                    grown[:count] = self._index_vectors[:count]
+                self._index_vectors = grown
+            self._index_vectors[count:needed] = vectors
+            self._index_keys.extend(keys)
+
+    def _remove_from_index(self, keys: list):
+        if not keys:
+            return
+        removed = set(keys)
+        with self._index_lock:
+            count = len(self._index_keys)
+            keep = [i for i, k in enumerate(self._index_keys) if k not in removed]
+            if len(keep) == count:
+                return
+            # Compact the surviving rows to the front of the buffer
+            self._index_vectors[:len(keep)] = self._index_vectors[keep]
+            self._index_keys = [self._index_keys[i] for i in keep]
+
+    def _find_similar(self, key: str):
+        """Return the cached key closest to this one, if it is close enough."""
+        query = np.asarray(self._embed([key])[0], dtype=np.float32)
+        self._last_query = (key, query)
+        with self._index_lock:
+            count = len(self._index_keys)
+            if not count:
+                return None
+            # Vectors are normalized, so one matrix-vector product gives the
+            # cosine similarity against every cached question
+            sims = self._index_vectors[:count] @ query
+            best = int(np.argmax(sims))
+            if sims[best] >= self.SIMILARITY_THRESHOLD:
+                return self._index_keys[best]
+        return None
+
+    def get_audio(self, text: str):
+        """Return cached audio bytes for a piece of spoken text, or None."""
+        return self._get("speech", "audio", text)
+
+    def put_audio(self, text: str, audio: bytes):
+        """Cache the audio for a piece of spoken text."""
+        self._put("speech", "audio", text, audio, max_bytes=self.MAX_AUDIO_BYTES)
+
+    def _get(self, table: str, column: str, key: str, max_age: float = None):
+        with self._lock:
+            row = self._db.execute(
+                f"SELECT {column}, created FROM {table} WHERE k = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            now = time.time()
+            if max_age is not None and now - row[1] > max_age:
+                self._db.execute(f"DELETE FROM {table} WHERE k = ?", (key,))
+                return None
+            self._db.execute(
+                f"UPDATE {table} SET last_used = ? WHERE k = ?", (now, key)
+            )
+            return row[0]
+
+    def _put(self, table: str, column: str, key: str, value,
+             max_rows: int = None, max_bytes: int = None) -> list:
+        """Insert or replace a row and return the keys evicted to make room."""
+        with self._lock:
+            now = time.time()
+            self._db.execute(
+                f"INSERT OR REPLACE INTO {table} (k, {column}, created, last_used) "
+                "VALUES (?, ?, ?, ?)",
+                (key, value, now, now)
+            )
+            # Evict the least recently used rows beyond the cap
+            if max_rows is not None:
+                evicted = [row[0] for row in self._db.execute(
+                    f"SELECT k FROM {table} WHERE k NOT IN "
+                    f"(SELECT k FROM {table} ORDER BY last_used DESC LIMIT ?)",
+                    (max_rows,)
+                )]
+            else:
+                evicted = [row[0] for row in self._db.execute(
+                    f"SELECT k FROM (SELECT k, SUM(length({column})) OVER "
+                    f"(ORDER BY last_used DESC, k) AS running FROM {table}) "
+                    "WHERE running > ?",
+                    (max_bytes,)
+                )]
+            self._db.executemany(
+                f"DELETE FROM {table} WHERE k = ?", [(k,) for k in evicted]
+            )
+            return evicted
+
 
 class CuriosityAgent:
     """A kid-friendly Q&A agent using OpenAI."""
 
+    # History grows append-only (so the prompt prefix stays cacheable) until
+    # it hits the max, then drops back to the most recent turns in one step;
+    # the dropped turns are folded into a short summary by a cheap model
+    HISTORY_MAX_MESSAGES = 12
+    HISTORY_KEEP_MESSAGES = 6
+
+    SUMMARY_PROMPT = """Summarize this chat between a young child and a helper.
+Keep the topics and facts the child asked about. Use 80 words or fewer.
+Write it as plain sentences, kid-friendly."""
+
     SYSTEM_PROMPT = """You are a friendly helper for a 5-6 year old child.
 
 STRICT RULES:
@@ -92,6 +402,9 @@ BAD (never do this):
 
 REMEMBER: Answer only. No questions. End with a period or exclamation mark."""
 
+    # Built once and sent first, unchanged, on every request
+    SYSTEM_MESSAGE = {"role": "system", "content": SYSTEM_PROMPT}
+
     def __init__(self, api_key: str = None):
         """Initialize the agent with OpenAI API key."""
         # Priority: passed key > config.json > environment variable
@@ -103,14 +416,56 @@ REMEMBER: Answer only. No questions. End with a period or exclamation mark."""
                 "set OPENAI_API_KEY environment variable, or pass api_key parameter."
             )
 
-        self.client = OpenAI(api_key=self.api_key)
-        self.conversation_history = []
+        # One pooled client for chat, TTS and summaries, so requests reuse
+        # the same TCP/TLS connection instead of setting up new ones
+        self._http = httpx.Client(
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_keepalive_connections=8),
+            timeout=httpx.Timeout(30.0, connect=3.0)
+        )
+        atexit.register(self._http.close)
+        self.client = OpenAI(api_key=self.api_key, http_client=self._http)
+
+        # Warm the connection and both models in parallel while the child
+        # types the first question (daemon threads, so quitting never waits)
+        for warmup in (self._warm_chat, self._warm_tts):
+            threading.Thread(target=warmup, daemon=True).start()
+
+        # Repeat questions are answered (and spoken) from the local cache
+        try:
+            self.cache = AnswerCache()
+        except sqlite3.Error as e:
+            print(f"Note: answer cache disabled ({e})")
+            self.cache = None
+        if self.cache and SEMANTIC_CACHE_AVAILABLE:
+            threading.Thread(
+                target=self.cache.load_semantic_index, daemon=True
+            ).start()
+
+        self.conversation_history = collections.deque()
+        self.session_id = uuid.uuid4().hex
+        self.summary = ""
+        self._summary_lock = threading.Lock()
         self.muted = False
 
+        # Sentences are synthesized by one worker and played by another, so
+        # sentence N plays while sentence N+1 is still being synthesized
+        self._speech_queue = queue.Queue()
+        self._playback_queue = queue.Queue()
+        self._speech_generation = 0  # bumped by stop_speaking()
+        self._pcm_stream = None  # opened by the playback worker on first use
+        self._pcm_failed = False  # set if the output device can't be used
+        threading.Thread(target=self._speech_worker, daemon=True).start()
+        threading.Thread(target=self._playback_worker, daemon=True).start()
+
         # Initialize speech recognition if available
         if SPEECH_RECOGNITION_AVAILABLE:
             self.recognizer = sr.Recognizer()
-            self.microphone = sr.Microphone()
+            # Calibrated once on first use; a fixed threshold after that
+            self.recognizer.dynamic_energy_threshold = False
+            self._mic_calibrated = False
+            # Smaller buffers than the default 1024 frames cut capture latency
+            self.microphone = sr.Microphone(chunk_size=512)
 
         print("\n🌟 Curiosity Explorer - Ask Me Anything! 🌟")
         print("=" * 45)
@@ -121,95 +476,332 @@ REMEMBER: Answer only. No questions. End with a period or exclamation mark."""
             print("  Type 'voice' to ask with your voice")
         print("  Type 'mute' to turn off voice")
         print("  Type 'unmute' to turn on voice")
+        print("  Type 'stop' (or press Ctrl+C while I answer) to stop talking")
         print("  Type 'clear' to start fresh")
         print("  Type 'quit' to exit")
         print("=" * 45 + "\n")
 
+    def _warm_chat(self):
+        """Make a cheap API call so the first question reuses a warm connection."""
+        try:
+            self.client.with_options(timeout=5, max_retries=0).models.retrieve("gpt-4o-mini")
+        except Exception:
+            pass
+
+    def _warm_tts(self):
+        """Synthesize a tiny clip so the first spoken sentence starts sooner."""
+        try:
+            self.client.with_options(timeout=5, max_retries=0).audio.speech.create(
+                model="tts-1",
+                voice="shimmer",
+                input=".",
+                response_format="pcm" if self._use_pcm() else "mp3"
+            )
+        except Exception:
+            pass
+
     def ask(self, question: str) -> str:
         """Ask a question and get a kid-friendly answer."""
+        return "".join(self.ask_stream(question)).strip()
+
+    def ask_stream(self, question: str):
+        """Ask a question and yield the answer piece by piece as it arrives."""
         if not question.strip():
-            return "Please ask me something!"
+            yield "Please ask me something!"
+            return
+
+        # Cached answers were generated without context, so the cache is only
+        # used for a question that opens a conversation ("why?" or "how big is
+        # it?" later on depends on what came before)
+        use_cache = bool(self.cache) and \
+            not self.conversation_history and not self.summary
 
         # Add to conversation history
-        self.conversation_history.append({
-            "role": "user",
-            "content": question
-        })
+        user_message = {"role": "user", "content": question}
+        self.conversation_history.append(user_message)
+        self._trim_history()
 
-        # Keep only last 6 messages for context
-        recent_history = self.conversation_history[-6:]
+        cached = self.cache.get_answer(question) if use_cache else None
+        if cached:
+            self.conversation_history.append({
+                "role": "assistant",
+                "content": cached
+            })
+            # Replay sentence by sentence so speech hits the audio cache too
+            yield from _SENTENCE_SPLIT_RE.split(cached)
+            return
 
         try:
+            # The unchanged system prompt and summary followed by the
+            # append-only history let the API reuse its prompt cache
             response = self.client.chat.completions.create(
                 model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": self.SYSTEM_PROMPT},
-                    *recent_history
-                ],
+                messages=self._build_messages(),
                 max_tokens=150,
-                temperature=0.7
+                temperature=0.7,
+                user=self.session_id,
+                stream=True
             )
 
-            answer = response.choices[0].message.content.strip()
+            # Close the stream even if the caller stops reading early
+            parts = []
+            try:
+                for chunk in response:
+                    if not chunk.choices:
+                        continue
+                    delta = chunk.choices[0].delta.content
+                    if delta:
+                        parts.append(delta)
+                        yield delta
+            finally:
+                response.close()
+
+            answer = "".join(parts).strip()
 
             # Add to history
             self.conversation_history.append({
                 "role": "assistant",
                 "content": answer
             })
+            if use_cache and answer:
+                self.cache.put_answer(question, answer)
 
-            return answer
+        except (GeneratorExit, KeyboardInterrupt):
+            # Interrupted mid-answer
+            self._drop_unanswered(user_message)
+            raise
 
         except Exception as e:
-            return f"Oops! Something went wrong. Let's try again! ({str(e)[:50]})"
+            self._drop_unanswered(user_message)
+            yield f"Oops! Something went wrong. Let's try again! ({str(e)[:50]})"
+
+    def _drop_unanswered(self, user_message: dict):
+        """Remove a question that got no answer, so the next request doesn't
+        send two user turns in a row."""
+        if self.conversation_history and \
+                self.conversation_history[-1] is user_message:
+            self.conversation_history.pop()
+
+    def _trim_history(self):
+        """Drop old turns once the history is too long, keeping whole turns."""
+        if len(self.conversation_history) <= self.HISTORY_MAX_MESSAGES:
+            return
+        history = self.conversation_history
+        dropped = []
+        # Never start the kept history on an assistant reply
+        while len(history) > self.HISTORY_KEEP_MESSAGES or \
+                (history and history[0]["role"] != "user"):
+            dropped.append(history.popleft())
+
+        # Summarize on a daemon thread so neither the current answer nor
+        # quitting waits for it
+        threading.Thread(
+            target=self._summarize,
+            args=(dropped, self.session_id),
+            daemon=True
+        ).start()
+
+    def _summarize(self, dropped: list, session_id: str):
+        """Fold dropped turns into the running conversation summary."""
+        with self._summary_lock:
+            transcript = "\n".join(
+                f"{'Child' if m['role'] == 'user' else 'Helper'}: {m['content']}"
+                for m in dropped
+            )
+            if self.summary:
+                transcript = f"Earlier: {self.summary}\n{transcript}"
+
+            try:
+                response = self.client.chat.completions.create(
+                    model="gpt-4o-mini",
+                    messages=[
+                        {"role": "system", "content": self.SUMMARY_PROMPT},
+                        {"role": "user", "content": transcript}
+                    ],
+                    max_tokens=120,
+                    temperature=0.3
+                )
+                summary = response.choices[0].message.content.strip()
+            except Exception:
+                return
+
+            # Ignore results for a conversation that has since been cleared
+            if session_id == self.session_id:
+                self.summary = summary
+
+    def _build_messages(self) -> list:
+        """Build the chat request: system prompt, summary, recent turns."""
+        messages = [self.SYSTEM_MESSAGE]
+        if self.summary:
+            messages.append({
+                "role": "system",
+                "content": f"Earlier in this chat: {self.summary}"
+            })
+        messages.extend(self.conversation_history)
+        return messages
 
     def speak(self, text: str):
-        """Convert text to speech using OpenAI TTS."""
+        """Queue text to be spoken with OpenAI TTS."""
         if self.muted:
             return
 
         # Clean text for speech (remove emojis and special chars)
         clean_text = self._clean_for_speech(text)
-        if not clean_text:
-            return
+        if clean_text:
+            self._speech_queue.put((self._speech_generation, clean_text))
+
+    def stop_speaking(self):
+        """Drop any sentences still waiting to be synthesized or played."""
+        self._speech_generation += 1
+        for pending in (self._speech_queue, self._playback_queue):
+            while True:
+                try:
+                    pending.get_nowait()
+                except queue.Empty:
+                    break
+                pending.task_done()
+
+    def _use_pcm(self) -> bool:
+        """Whether speech is played as PCM through sounddevice."""
+        return SOUNDDEVICE_AVAILABLE and not self._pcm_failed
 
+    def _speech_worker(self):
+        """Synthesize queued sentences in order and hand them to playback."""
+        # Queue items carry the generation they were queued in, so anything
+        # queued before the last stop_speaking() is dropped
+        while True:
+            generation, clean_text = self._speech_queue.get()
+            try:
+                if generation != self._speech_generation:
+                    continue
+                if self._use_pcm():
+                    self._stream_pcm(clean_text, generation)
+                else:
+                    audio = self._synthesize(clean_text)
+                    if audio:
+                        self._playback_queue.put((generation, "mp3", audio))
+            finally:
+                self._speech_queue.task_done()
+
+    def _playback_worker(self):
+        """Play synthesized sentences one after another."""
+        while True:
+            generation, audio_format, audio = self._playback_queue.get()
+            try:
+                if generation != self._speech_generation:
+                    continue
+                if audio_format == "pcm":
+                    self._play_pcm(audio)
+                else:
+                    self._play_mp3(audio)
+            finally:
+                self._playback_queue.task_done()
+
+    def _stream_pcm(self, clean_text: str, generation: int):
+        """Convert text to PCM speech, queueing chunks for playback as they arrive."""
+        cache_key = f"pcm:{clean_text}"
         try:
-            # Use OpenAI TTS
-            response = self.client.audio.speech.create(
+            audio = self.cache.get_audio(cache_key) if self.cache else None
+            if audio is not None:
+                for start in range(0, len(audio), PCM_CHUNK_BYTES):
+                    self._playback_queue.put(
+                        (generation, "pcm", audio[start:start + PCM_CHUNK_BYTES])
+                    )
+                return
+
+            parts = []
+            with self.client.audio.speech.with_streaming_response.create(
                 model="tts-1",
                 voice="shimmer",  # Friendly, expressive voice
                 input=clean_text,
-                speed=1.0
-            )
+                speed=1.0,
+                response_format="pcm"
+            ) as response:
+                # Chunks are a fixed even size (except the last), so each
+                # holds whole 16-bit samples and can be played immediately
+                for chunk in response.iter_bytes(PCM_CHUNK_BYTES):
+                    if generation != self._speech_generation or self._pcm_failed:
+                        return  # Stopped; drop the rest of this sentence
+                    parts.append(chunk)
+                    self._playback_queue.put((generation, "pcm", chunk))
+
+            if self.cache:
+                self.cache.put_audio(cache_key, b"".join(parts))
 
-            # Save to temp file and play
-            with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as f:
-                temp_path = f.name
-                response.stream_to_file(temp_path)
+        except Exception as e:
+            print(f"(Voice unavailable: {str(e)[:30]})")
 
-            # Play audio in background
-            if PLAYSOUND_AVAILABLE:
-                threading.Thread(
-                    target=self._play_and_cleanup,
-                    args=(temp_path,),
-                    daemon=True
-                ).start()
-            else:
-                # Try system command as fallback
-                if sys.platform == "darwin":  # macOS
-                    os.system(f'afplay "{temp_path}" && rm "{temp_path}"')
-                elif sys.platform == "linux":
-                    os.system(f'mpg123 "{temp_path}" 2>/dev/null && rm "{temp_path}"')
-                else:
-                    print("(Audio playback not available on this system)")
+    def _play_pcm(self, chunk: bytes):
+        """Write a chunk of PCM audio to the output stream."""
+        if self._pcm_failed:
+            return  # PCM chunks queued before the device failed
+        try:
+            if self._pcm_stream is None:
+                self._pcm_stream = sd.RawOutputStream(
+                    samplerate=PCM_SAMPLE_RATE, channels=1, dtype="int16"
+                )
+                self._pcm_stream.start()
+            self._pcm_stream.write(chunk)
+        except Exception as e:
+            # No usable output device (missing or busy): say so once and
+            # send later sentences down the mp3 path
+            print(f"(Voice unavailable: {str(e)[:30]})")
+            self._pcm_failed = True
+            if self._pcm_stream is not None:
+                try:
+                    self._pcm_stream.close()
+                except Exception:
+                    pass
+                self._pcm_stream = None
+
+    def _synthesize(self, clean_text: str):
+        """Convert text to mp3 speech and return the audio bytes."""
+        try:
+            cache_key = f"mp3:{clean_text}"
+            audio = self.cache.get_audio(cache_key) if self.cache else None
+            if audio is None:
+                # Use OpenAI TTS
+                response = self.client.audio.speech.create(
+                    model="tts-1",
+                    voice="shimmer",  # Friendly, expressive voice
+                    input=clean_text,
+                    speed=1.0
+                )
+                audio = response.content
+                if self.cache:
+                    self.cache.put_audio(cache_key, audio)
+            return audio
 
         except Exception as e:
             print(f"(Voice unavailable: {str(e)[:30]})")
+            return None
+
+    def _play_mp3(self, audio: bytes):
+        """Play mp3 audio, going through a temp file only if the player needs one."""
+        # System commands run without a shell; blocking here is fine because
+        # this runs on the playback worker and keeps clips in order
+        try:
+            if PLAYSOUND_AVAILABLE or sys.platform == "darwin":
+                # playsound and afplay can only play from a file path
+                with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as f:
+                    f.write(audio)
+                self._play_and_cleanup(f.name)
+            elif sys.platform == "linux":
+                # mpg123 reads from stdin, so the audio never touches disk
+                subprocess.run(["mpg123", "-q", "-"], input=audio,
+                               stderr=subprocess.DEVNULL)
+            else:
+                print("(Audio playback not available on this system)")
+        except:
+            pass
 
     def _play_and_cleanup(self, filepath: str):
         """Play audio file and clean up."""
         try:
-            playsound(filepath)
+            if PLAYSOUND_AVAILABLE:
+                playsound(filepath)
+            else:  # macOS
+                subprocess.run(["afplay", filepath])
         except:
             pass
         finally:
@@ -220,30 +812,18 @@ REMEMBER: Answer only. No questions. End with a period or exclamation mark."""
 
     def _clean_for_speech(self, text: str) -> str:
         """Remove emojis, URLs, and other non-speech elements."""
-        import re
-
-        # Remove emojis
-        emoji_pattern = re.compile(
-            "["
-            "\U0001F300-\U0001F9FF"  # Various symbols and pictographs
-            "\U00002600-\U000026FF"  # Misc symbols
-            "\U00002700-\U000027BF"  # Dingbats
-            "]+",
-            flags=re.UNICODE
-        )
-        text = emoji_pattern.sub('', text)
+        # Remove emojis (most sentences are plain ASCII and can skip this)
+        if not text.isascii():
+            text = _EMOJI_RE.sub('', text)
 
-        # Remove URLs
-        text = re.sub(r'https?://\S+', '', text)
-        text = re.sub(r'www\.\S+', '', text)
+        # Remove URLs (http(s) and bare www links in one pass)
+        text = _URL_RE.sub('', text)
 
         # Remove markdown links
-        text = re.sub(r'\[([^\]]+)\]\([^)]+\)', r'\1', text)
+        text = _MD_LINK_RE.sub(r'\1', text)
 
         # Clean up whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
-
-        return text
+        return _WS_RE.sub(' ', text).strip()
 
     def listen(self) -> str:
         """Listen for voice input and return transcribed text."""
@@ -255,11 +835,15 @@ REMEMBER: Answer only. No questions. End with a period or exclamation mark."""
 
         try:
             with self.microphone as source:
-                self.recognizer.adjust_for_ambient_noise(source, duration=0.5)
+                if not self._mic_calibrated:
+                    self.recognizer.adjust_for_ambient_noise(source, duration=1.0)
+                    self._mic_calibrated = True
                 audio = self.recognizer.listen(source, timeout=5, phrase_time_limit=10)
 
             print("Processing...")
-            text = self.recognizer.recognize_google(audio)
+            text = self._transcribe(audio)
+            if not text:
+                raise sr.UnknownValueError()
             print(f"You said: {text}")
             return text
 
@@ -269,16 +853,29 @@ REMEMBER: Answer only. No questions. End with a period or exclamation mark."""
         except sr.UnknownValueError:
             print("Couldn't understand. Try again!")
             return ""
-        except sr.RequestError as e:
+        except (sr.RequestError, openai.APIError) as e:
             print(f"Speech service error: {e}")
             return ""
         except Exception as e:
             print(f"Error: {e}")
             return ""
 
+    def _transcribe(self, audio) -> str:
+        """Transcribe recorded audio with Whisper over the shared API client."""
+        # 16 kHz mono WAV is all Whisper uses, and keeps the upload small
+        transcript = self.client.audio.transcriptions.create(
+            model="whisper-1",
+            file=("speech.wav", audio.get_wav_data(convert_rate=16000)),
+            language="en",
+            response_format="text"
+        )
+        return transcript.strip()
+
     def clear_history(self):
         """Clear conversation history."""
-        self.conversation_history = []
+        self.conversation_history = collections.deque()
+        self.summary = ""
+        self.session_id = uuid.uuid4().hex
         print("\n✨ Starting fresh! Ask me anything!\n")
 
     def run(self):
@@ -307,6 +904,10 @@ REMEMBER: Answer only. No questions. End with a period or exclamation mark."""
                     print("🔊 Voice unmuted")
                     continue
 
+                elif user_input == 'stop':
+                    self.stop_speaking()
+                    continue
+
                 elif user_input == 'voice':
                     user_input = self.listen()
                     if not user_input:
@@ -315,13 +916,29 @@ REMEMBER: Answer only. No questions. End with a period or exclamation mark."""
                 elif not user_input:
                     continue
 
-                # Get answer
+                # Stream the answer, speaking each sentence as it completes
                 print("\n🤔 Thinking...")
-                answer = self.ask(user_input)
-                print(f"\n🌟 Answer: {answer}")
-
-                # Speak the answer
-                self.speak(answer)
+                print("\n🌟 Answer: ", end="", flush=True)
+                sentence_buf = ""
+                answer_stream = self.ask_stream(user_input)
+                try:
+                    for delta in answer_stream:
+                        print(delta, end="", flush=True)
+                        # Speak every finished sentence, keep the unfinished tail
+                        *sentences, sentence_buf = _SENTENCE_SPLIT_RE.split(
+                            sentence_buf + delta
+                        )
+                        for sentence in sentences:
+                            self.speak(sentence)
+                except KeyboardInterrupt:
+                    # Ctrl+C interrupts the answer, not the whole session
+                    answer_stream.close()
+                    self.stop_speaking()
+                    print("\n✋ Stopped!")
+                    continue
+                print()
+                if sentence_buf:
+                    self.speak(sentence_buf)
 
             except KeyboardInterrupt:
                 print("\n\n👋 Bye! Keep being curious!\n")
@@ -348,8 +965,8 @@ def main():
             return
         # Save to config.json for future use
         try:
-            with open(CONFIG_FILE, 'w') as f:
-                json.dump({"openai_api_key": api_key}, f, indent=2)
+            write_config({"openai_api_key": api_key})
+            load_api_key_from_config.cache_clear()
             print(f"✅ API key saved to {CONFIG_FILE}")
         except Exception as e:
             print(f"Warning: Could not save to config.json: {e}")
@@ -10,8 +10,34 @@ Run this once to configure your OpenAI API key for both:
 import json
 from pathlib import Path
 
+# Same config.json handling as curiosity_agent.py (importing it here would
+# require openai to be installed just to set up the key)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 CONFIG_FILE = Path(__file__).parent / "config.json"
 
+
+def read_config() -> dict:
+    """Read the shared config.json file."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(CONFIG_FILE.read_bytes())
+    with open(CONFIG_FILE) as f:
+        return json.load(f)
+
+
+def write_config(config: dict):
+    """Write the shared config.json file."""
+    if ORJSON_AVAILABLE:
+        CONFIG_FILE.write_bytes(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+    else:
+        with open(CONFIG_FILE, 'w') as f:
+            json.dump(config, f, indent=2)
+
+
 def main():
     print("\n🔑 Curiosity Explorer - API Key Setup")
     print("=" * 40)
@@ -20,9 +46,8 @@ def main():
     existing_key = None
     if CONFIG_FILE.exists():
         try:
-            with open(CONFIG_FILE) as f:
-                config = json.load(f)
-                existing_key = config.get("openai_api_key", "").strip()
+            config = read_config()
+            existing_key = config.get("openai_api_key", "").strip()
         except:
             pass
 
@@ -61,8 +86,7 @@ def main():
     config = {"openai_api_key": api_key}
 
     try:
-        with open(CONFIG_FILE, 'w') as f:
-            json.dump(config, f, indent=2)
+        write_config(config)
         print(f"\n✅ API key saved to {CONFIG_FILE}")
         print("\nYou can now run:")
         print("   python curiosity_agent.py")